@@ -16,13 +16,106 @@
 # Author: Dheeraj Kumar Srivastava <dheerajkumar.srivastava@amd.com>
 # Author: Amandeep Kaur Longia <amandeepkaur.longia@amd.com>
 
+import functools
+import hashlib
 import os
+import re
 import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from avocado import Test
-from avocado.utils import git, build, process, genio
+from avocado.utils import build, process
 from avocado.utils import cpu, linux_modules
 
+#: Per-test result lines printed by run_tests.sh, e.g. "PASS x2apic".
+_OUTCOME_RE = re.compile(r"^(PASS|FAIL|SKIP)\s+(\S+)")
+
+
+@functools.lru_cache(maxsize=None)
+def detect_kvm_module():
+    """
+    Detect the vendor specific KVM module (kvm_amd or kvm_intel) from the
+    CPU vendor. The result is cached since the vendor cannot change at
+    runtime, so parametrized test variants in the same process share one
+    /proc/cpuinfo parse. Returns None for unsupported vendors so that the
+    skip decision (and its exception) is not cached.
+    """
+    vendor = cpu.get_vendor()
+    if "amd" in vendor:
+        return "kvm_amd"
+    if "intel" in vendor:
+        return "kvm_intel"
+    return None
+
+
+def open_kmsg_cursor():
+    """
+    Open /dev/kmsg positioned at the end of the kernel ring buffer, so a
+    later read_new_kmsg() returns only messages logged after this point.
+    """
+    fd = os.open("/dev/kmsg", os.O_RDONLY | os.O_NONBLOCK)
+    os.lseek(fd, 0, os.SEEK_END)
+    return fd
+
+
+def read_new_kmsg(fd):
+    """
+    Read the kernel messages logged since the cursor was opened.
+    /dev/kmsg yields one record per read and EAGAIN once drained; EPIPE
+    means the reader was overrun and the next read continues from the
+    first available record.
+    """
+    records = []
+    while True:
+        try:
+            data = os.read(fd, 8192)
+        except BlockingIOError:
+            break
+        except BrokenPipeError:
+            continue
+        if not data:
+            break
+        records.append(data.decode(errors="replace"))
+    return "".join(records)
+
+
+def read_sysfs(path, size=4096):
+    """
+    Read a small sysfs file with a single fixed-size read. Sysfs values
+    fit in one page, so this skips the io-module buffer allocation and
+    codec machinery that one-line files do not need.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size).rstrip(b"\n\x00").decode()
+    finally:
+        os.close(fd)
+
+
+def read_module_parameter(entry):
+    """
+    Read one sysfs parameter file, returning (name, value) or
+    (name, None) when the parameter is unreadable (e.g. write-only).
+    """
+    try:
+        return entry.name, read_sysfs(entry.path)
+    except OSError:
+        return entry.name, None
+
+
+def capture_module_parameters(params_dir):
+    """
+    Read all readable parameter files under a module's sysfs parameters
+    directory in a single directory scan and return them as a dict.
+    Unreadable parameters (e.g. write-only) are skipped.
+    """
+    with os.scandir(params_dir) as entries:
+        results = [read_module_parameter(e)
+                   for e in entries if e.is_file(follow_symlinks=False)]
+    return {name: value for name, value in results if value is not None}
+
 
 # pylint: disable=too-many-instance-attributes
 class KVMUnitTest(Test):
@@ -55,46 +148,80 @@ class KVMUnitTest(Test):
         if self.accelerator:
             self.test_env["ACCEL"] = self.accelerator
 
-        # Detect, capture state, and configure the KVM module for the test environment.
-        self.detect_kvm_module()
-        self.capture_kvm_module_state()
-        self.check_and_configure_kvm_module()
-
-        # Clone the KVM unit tests repository
-        if not os.path.isdir(self.kvm_tests_dir):
-            git.get_repo(self.kvm_tests_repo, destination_dir=self.kvm_tests_dir)
-
-        # Build the KVM unit tests repository
-        os.chdir(self.kvm_tests_dir)
-        self.build_status = os.path.join(self.kvm_tests_dir, ".kvm_build_status")
-        rebuild_required = True
-
-        if os.path.exists(self.build_status):
-            with open(self.build_status, "r", encoding="utf-8") as f:
-                if f.read().strip() == "success":
-                    rebuild_required = False
-                    self.log.info("KVM unit test repository already built. Skipping rebuild.")
-                else:
-                    self.log.info("KVM unit test repository build failed. Rebuilding.")
-
-        if rebuild_required:
-            try:
-                configure_cmd = f"./configure {self.configure_args}"
-                process.system(configure_cmd, ignore_status=False, shell=True)
-                build.make(self.kvm_tests_dir, extra_args=f"-j {os.cpu_count()}")
-                with open(self.build_status, "w", encoding="utf-8") as f:
-                    f.write("success")
-            except Exception as err:
-                with open(self.build_status, "w", encoding="utf-8") as f:
-                    f.write("failed")
-                self.log.error("Failed to build kvm-unit-tests: %s", err)
-                raise
+        # Detect, capture state, and configure the KVM module in the
+        # background so the modprobe latency overlaps the clone and build
+        # below. No other thread touches the module state until the join.
+        module_setup = threading.Thread(target=self.setup_kvm_module)
+        module_setup.start()
+
+        # tearDown runs even when setUp fails, so the worker must be
+        # quiescent before any exception below unwinds past this frame;
+        # otherwise the restore path races its module state mutations.
+        try:
+            # Clone the KVM unit tests repository. A shallow clone with parallel
+            # submodule fetch is enough to build and run the tests.
+            if not os.path.isdir(os.path.join(self.kvm_tests_dir, ".git")):
+                process.run(
+                    f"git clone --depth=1 --jobs={os.cpu_count()} "
+                    f"--recurse-submodules --shallow-submodules "
+                    f"{self.kvm_tests_repo} {self.kvm_tests_dir}",
+                    shell=True,
+                )
+
+            # Build the KVM unit tests repository. The build stamp is keyed on
+            # the configure arguments and the checked-out commit, so a rebuild
+            # happens exactly when either changes.
+            self.build_status = os.path.join(self.kvm_tests_dir, ".kvm_build_status")
+            git_head = process.run(
+                f"git -C {self.kvm_tests_dir} rev-parse HEAD", shell=True
+            ).stdout_text.strip()
+            build_key = hashlib.sha1(
+                f"{self.configure_args}|{git_head}".encode()
+            ).hexdigest()
+            rebuild_required = True
+
+            # The stamp only exists after a successful build, so its presence
+            # plus a matching key is the whole rebuild check.
+            if os.path.exists(self.build_status):
+                with open(self.build_status, "r", encoding="utf-8") as f:
+                    if f.read().strip() == build_key:
+                        rebuild_required = False
+                        self.log.info("KVM unit test repository already built. Skipping rebuild.")
+                    else:
+                        self.log.info("KVM unit test build stamp is stale. Rebuilding.")
+
+            if rebuild_required:
+                # Compile through ccache when available so rebuilds after
+                # branch/commit switches hit the compilation cache.
+                if shutil.which("ccache"):
+                    os.environ["CC"] = "ccache gcc"
+                    os.environ["CCACHE_DIR"] = os.path.join(self.teststmpdir, ".ccache")
+                try:
+                    configure_cmd = f"cd {self.kvm_tests_dir}; ./configure {self.configure_args}"
+                    process.system(configure_cmd, ignore_status=False, shell=True)
+                    build.make(
+                        self.kvm_tests_dir,
+                        extra_args=f"-j {os.cpu_count()} --output-sync=target",
+                    )
+                    with open(self.build_status, "w", encoding="utf-8") as f:
+                        f.write(build_key)
+                except Exception as err:
+                    if os.path.exists(self.build_status):
+                        os.unlink(self.build_status)
+                    self.log.error("Failed to build kvm-unit-tests: %s", err)
+                    raise
+        finally:
+            module_setup.join()
+            if self._module_setup_exc is not None:
+                raise self._module_setup_exc
 
         # If no tests specified, list all available tests
         if self.tests == "":
             self.tests = " ".join(
                 process.run(
-                    "./run_tests.sh -l", shell=True, verbose=True
+                    f"cd {self.kvm_tests_dir}; ./run_tests.sh -l",
+                    shell=True,
+                    verbose=True,
                 ).stdout_text.split()
             )
 
@@ -109,6 +236,7 @@ class KVMUnitTest(Test):
         self.kvm_tests_dir = os.path.join(self.teststmpdir, "kvm-unit-tests")
         self.configure_args = self.params.get("configure_args", default="")
         self.tests = self.params.get("test", default="")
+        self.jobs = int(self.params.get("jobs", default=1) or 1)
         self.mode = self.params.get("mode", default=None)
         self.qemu_binary = self.params.get("qemu_binary")
         self.accelerator = self.params.get("accelerator")
@@ -116,21 +244,31 @@ class KVMUnitTest(Test):
         self.kvm_module_param = self.params.get("kvm_module_param", default="avic")
         self.test_env = os.environ.copy()
         self.initial_kvm_params = {}
-        self.initial_dmesg = "dmesg_initial.txt"
-        self.final_dmesg = "dmesg_final.txt"
+        self._param_fd = None
+        self._loaded = False
+        self._module_setup_exc = None
+
+    def setup_kvm_module(self):
+        """
+        Background worker that detects, captures and configures the KVM
+        module. Exceptions (including cancel/skip) are saved and re-raised
+        by setUp once the build has finished.
+        """
+        try:
+            self.detect_kvm_module()
+            self.capture_kvm_module_state()
+            self.check_and_configure_kvm_module()
+        except Exception as exc:  # pylint: disable=broad-except
+            self._module_setup_exc = exc
 
     def detect_kvm_module(self):
         """
-        Detects the CPU vendor and returns the appropriate KVM module and parameter.
+        Detects the CPU vendor and selects the appropriate KVM module.
         Defaults to 'kvm_amd' for AMD CPUs and 'kvm_intel' for Intel CPUs.
         """
-        vendor = cpu.get_vendor()
-        if "amd" in vendor:
-            self.kvm_module = "kvm_amd"
-        elif "intel" in vendor:
-            self.kvm_module = "kvm_intel"
-        else:
-            self.cancel(f"Unsupported CPU vendor: {vendor}")
+        self.kvm_module = detect_kvm_module()
+        if self.kvm_module is None:
+            self.cancel(f"Unsupported CPU vendor: {cpu.get_vendor()}")
 
     def capture_kvm_module_state(self):
         """
@@ -138,7 +276,10 @@ class KVMUnitTest(Test):
         - If the module is not loaded, save the state as 'unloaded'.
         - If the module is loaded, save the state as 'loaded'; read and store sysfs parameters.
         """
-        if not linux_modules.module_is_loaded(self.kvm_module):
+        # Probe /proc/modules once; load_kvm_module/unload_kvm_module keep
+        # the cached state in sync from here on.
+        self._loaded = linux_modules.module_is_loaded(self.kvm_module)
+        if not self._loaded:
             self.initial_kvm_params["__state__"] = "unloaded"
             return
 
@@ -152,14 +293,7 @@ class KVMUnitTest(Test):
         self.log.info(
             "Storing initial values for KVM module '%s' parameters.", self.kvm_module
         )
-        for param_name in os.listdir(kvm_sysfs_param_dir):
-            param_path = os.path.join(kvm_sysfs_param_dir, param_name)
-            if os.path.isfile(param_path) and os.access(param_path, os.R_OK):
-                try:
-                    value = genio.read_file(param_path).rstrip("\n")
-                    self.initial_kvm_params[param_name] = value
-                except (OSError, IOError) as e:
-                    self.log.warn("Failed to read parameter '%s': %s", param_name, e)
+        self.initial_kvm_params.update(capture_module_parameters(kvm_sysfs_param_dir))
 
     def check_and_configure_kvm_module(self):
         """
@@ -198,113 +332,242 @@ class KVMUnitTest(Test):
         - None: Loads the module without modifying the parameter.
         """
         if self.mode is None:
-            if not linux_modules.module_is_loaded(self.kvm_module):
-                linux_modules.load_module(self.kvm_module)
-                return
+            if not self._loaded:
+                self.load_kvm_module(self.kvm_module)
             return
 
-        if linux_modules.module_is_loaded(self.kvm_module):
-            linux_modules.unload_module(self.kvm_module)
+        if self._loaded:
+            self.unload_kvm_module()
 
         if self.mode == "accelerated":
-            process.run(f"dmesg -T > {self.initial_dmesg}", shell=True, ignore_status=True)
-            linux_modules.load_module(f"{self.kvm_module} {self.kvm_module_param}=1")
-            process.run(f"dmesg -T > {self.final_dmesg}", shell=True, ignore_status=True)
+            kmsg_fd = open_kmsg_cursor()
+            try:
+                self.load_kvm_module(f"{self.kvm_module} {self.kvm_module_param}=1")
 
-            if not self.verify_sysfs_param(("1", "Y")):
-                self.cancel(
-                    f"Failed to set '{self.kvm_module_param}=1' for module '{self.kvm_module}'."
-                )
-            self.verify_kvm_dmesg()
+                if not self.verify_sysfs_param(("1", "Y")):
+                    self.cancel(
+                        f"Failed to set '{self.kvm_module_param}=1' for module '{self.kvm_module}'."
+                    )
+                self.verify_kvm_dmesg(read_new_kmsg(kmsg_fd))
+            finally:
+                os.close(kmsg_fd)
 
         elif self.mode == "non-accelerated":
-            linux_modules.load_module(f"{self.kvm_module} {self.kvm_module_param}=0")
+            self.load_kvm_module(f"{self.kvm_module} {self.kvm_module_param}=0")
 
             if not self.verify_sysfs_param(("0", "N")):
                 self.cancel(
                     f"Failed to set '{self.kvm_module_param}=0' for module '{self.kvm_module}'."
                 )
 
+    def load_kvm_module(self, module_args):
+        """
+        Load the KVM module (with optional parameters) and update the
+        cached loaded state.
+        """
+        linux_modules.load_module(module_args)
+        self._loaded = True
+
+    def unload_kvm_module(self):
+        """
+        Unload the KVM module, dropping the cached parameter fd first
+        since the sysfs node disappears with the module.
+        """
+        self.close_param_fd()
+        linux_modules.unload_module(self.kvm_module)
+        self._loaded = False
+
     def verify_sysfs_param(self, expected_value):
         """
         Check and validate kvm module against expected_value
         expected_value: List of expected values for kvm module parameter
+
+        The parameter file is opened once and re-read through the cached
+        fd on later verifications; sysfs re-evaluates the value on every
+        read, so no reopen is needed while the module stays loaded.
         """
-        param_path = f"/sys/module/{self.kvm_module}/parameters/{self.kvm_module_param}"
-        if not os.path.exists(param_path):
-            self.cancel(f"Parameter sysfs path not found: {param_path}")
+        if self._param_fd is None:
+            param_path = f"/sys/module/{self.kvm_module}/parameters/{self.kvm_module_param}"
+            try:
+                self._param_fd = os.open(param_path, os.O_RDONLY)
+            except OSError:
+                self.cancel(f"Parameter sysfs path not found: {param_path}")
 
-        current_value = genio.read_file(param_path).rstrip("\n")
-        return current_value in expected_value
+        # Bool/numeric params are one or two characters, newline-terminated
+        # only on newer kernels, so compare the stripped raw bytes without
+        # the decode round trip.
+        raw = os.pread(self._param_fd, 8, 0)
+        return raw.rstrip(b"\n\x00") in tuple(v.encode() for v in expected_value)
 
-    def verify_kvm_dmesg(self):
+    def close_param_fd(self):
         """
-        Validates AVIC and x2AVIC enablement via dmesg logs.
+        Close the cached parameter fd. Must be called whenever the module
+        is unloaded, as the sysfs node (and the fd) goes stale.
         """
-        diff = process.run(
-            f"diff {self.initial_dmesg} {self.final_dmesg}",
-            ignore_status=True,
-            shell=True,
-        ).stdout_text
+        if self._param_fd is not None:
+            os.close(self._param_fd)
+            self._param_fd = None
 
-        # Check for "AVIC enabled" in the dmesg diff (required for accelerated mode)
-        if "AVIC enabled" not in diff:
+    def verify_kvm_dmesg(self, kmsg):
+        """
+        Validates AVIC and x2AVIC enablement from the kernel messages
+        logged while the module was loaded.
+        """
+        # Check for "AVIC enabled" in the new messages (required for accelerated mode)
+        if "AVIC enabled" not in kmsg:
             self.cancel("AVIC not enabled; cancelling accelerated mode tests.")
 
         # Check for "x2AVIC enabled" only if the test mode is 'x2apic'
-        if "x2apic" in self.tests.split(" ") and "x2AVIC enabled" not in diff:
-            self.tests = " ".join(test for test in self.tests.split(" ") if test != "x2apic")
+        tests_list = self.tests.split(" ")
+        if "x2apic" in tests_list and "x2AVIC enabled" not in kmsg:
+            self.tests = " ".join(test for test in tests_list if test != "x2apic")
             if self.tests == "":
                 self.cancel("x2AVIC not enabled. Cancelling the 'x2apic' test in accelerated mode.")
             self.log.warn("x2AVIC not enabled. Removing 'x2apic' from test list.")
 
+    def run_tests_parallel(self):
+        """
+        Shard the tests across worker threads, invoking `run_tests.sh` once
+        per test, and return the combined output. The work happens in
+        subprocesses so threads are sufficient. Intended for independent
+        tests on idle hosts; tests contending for hardware should keep
+        the default of a single job.
+        """
+        tests = self.tests.split()
+        outputs = []
+        with ThreadPoolExecutor(max_workers=min(self.jobs, len(tests))) as executor:
+            futures = [executor.submit(self.run_test_isolated, test) for test in tests]
+            for future in as_completed(futures):
+                outputs.append(future.result())
+        return "\n".join(outputs)
+
+    def run_test_isolated(self, test):
+        """
+        Run one test in a private hardlink copy of the built checkout and
+        harvest its log before returning. run_tests.sh rotates the logs
+        directory of its working directory at startup, so concurrent
+        invocations sharing one checkout delete each other's logs or lose
+        the mkdir race and exit early; a hardlink copy on the same
+        filesystem isolates them without duplicating the build.
+        """
+        worker_dir = os.path.join(self.teststmpdir, f"kvm-unit-tests-{test}")
+        shutil.rmtree(worker_dir, ignore_errors=True)
+        process.run(f"cp -al {self.kvm_tests_dir} {worker_dir}", shell=True)
+        try:
+            result = process.run(
+                f"cd {worker_dir}; ./run_tests.sh {test}",
+                shell=True,
+                ignore_status=False,
+                verbose=True,
+                env=self.test_env,
+            )
+            try:
+                with open(os.path.join(worker_dir, "logs", f"{test}.log"), "rb") as f:
+                    data = f.read()
+            except OSError:
+                data = None
+            if data is not None:
+                with open(os.path.join(self.outputdir, f"{test}.log"), "wb") as f:
+                    f.write(data)
+                self.log.info("%s", data.decode(errors="replace"))
+            return result.stdout_text
+        finally:
+            shutil.rmtree(worker_dir, ignore_errors=True)
+
+    def run_tests_streaming(self):
+        """
+        Run all tests in one `run_tests.sh` invocation and yield its output
+        line by line as it is produced, so the caller can classify results
+        on the fly without buffering the full log in memory.
+        """
+        proc = subprocess.Popen(
+            f"./run_tests.sh {self.tests}",
+            shell=True,
+            cwd=self.kvm_tests_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env=self.test_env,
+            bufsize=1,
+            text=True,
+        )
+        with proc.stdout:
+            for line in proc.stdout:
+                line = line.rstrip("\n")
+                self.log.info("%s", line)
+                yield line
+        if proc.wait() != 0:
+            self.fail(
+                f"Test '{self.tests}' failed to execute with exit code {proc.returncode}"
+            )
+
+    def collect_test_logs(self):
+        """
+        Copy per-test logs for the executed tests into the test output
+        directory and mirror their contents into the avocado log. The logs
+        directory is scanned once instead of probing each expected file.
+        """
+        logs_dir = os.path.join(self.kvm_tests_dir, "logs")
+        wanted_logs = {f"{test}.log" for test in self.tests.split()}
+        try:
+            with os.scandir(logs_dir) as entries:
+                log_entries = [e for e in entries if e.name in wanted_logs]
+        except FileNotFoundError:
+            return
+
+        # Read each log once and reuse the bytes for both the copy into
+        # the output directory and the avocado log.
+        for entry in log_entries:
+            with open(entry.path, "rb") as f:
+                data = f.read()
+            with open(os.path.join(self.outputdir, entry.name), "wb") as f:
+                f.write(data)
+            self.log.info("%s", data.decode(errors="replace"))
+
     def test(self):
         """
-        Run KVM unit tests listed in `self.tests` using `run_tests.sh` and log results.
+        Run KVM unit tests listed in `self.tests` in a single `run_tests.sh`
+        invocation and classify the per-test result lines as they stream in.
         Fails the test suite if any test fails or if execution encounters an error.
         """
-        os.chdir(self.kvm_tests_dir)
         failed_tests, skipped_tests, passed_tests = [], [], []
 
-        try:
-            for test in self.tests.split(" "):
-                result = process.run(
-                    f"./run_tests.sh {test}",
-                    shell=True,
-                    ignore_status=False,
-                    verbose=True,
-                    env=self.test_env,
-                ).stdout_text
-
-                if "FAIL" in result:
-                    failed_tests.append(test)
-                elif "SKIP" in result:
-                    skipped_tests.append(test)
-                elif "PASS" in result:
-                    passed_tests.append(test)
-
-                log_path = f"logs/{test}.log"
-                if os.path.exists(log_path):
-                    shutil.copy(log_path, self.outputdir)
-                    with open(log_path, "r", encoding="utf-8") as f:
-                        result = f.read()
-                        self.log.info("%s", result)
-
-            for t, label in [
-                (failed_tests, "failed"),
-                (skipped_tests, "skipped"),
-                (passed_tests, "passed"),
-            ]:
-                if t:
-                    self.log.info("%d test(s) %s: %s.", len(t), label, t)
-
-            if failed_tests:
-                self.fail(
-                    f"{len(failed_tests)} test(s) failed: {(failed_tests)}. Check logs for details."
-                )
-
-        except process.CmdError as err:
-            self.fail(f"Test '{self.tests}' failed to execute: {err}")
+        if self.jobs > 1:
+            try:
+                lines = self.run_tests_parallel().splitlines()
+            except process.CmdError as err:
+                self.fail(f"Test '{self.tests}' failed to execute: {err}")
+        else:
+            lines = self.run_tests_streaming()
+
+        for line in lines:
+            match = _OUTCOME_RE.match(line)
+            if not match:
+                continue
+            outcome, test = match.groups()
+            if outcome == "FAIL":
+                failed_tests.append(test)
+            elif outcome == "SKIP":
+                skipped_tests.append(test)
+            else:
+                passed_tests.append(test)
+
+        # Parallel workers harvest their own logs from their isolated
+        # checkouts; only the serial path leaves logs behind to collect.
+        if self.jobs == 1:
+            self.collect_test_logs()
+
+        for t, label in [
+            (failed_tests, "failed"),
+            (skipped_tests, "skipped"),
+            (passed_tests, "passed"),
+        ]:
+            if t:
+                self.log.info("%d test(s) %s: %s.", len(t), label, t)
+
+        if failed_tests:
+            self.fail(
+                f"{len(failed_tests)} test(s) failed: {(failed_tests)}. Check logs for details."
+            )
 
     def tearDown(self):
         """
@@ -313,15 +576,28 @@ class KVMUnitTest(Test):
         if not hasattr(self, "initial_kvm_params"):
             return
 
+        self.close_param_fd()
         self.log.info("Restoring the initial setup")
         if self.initial_kvm_params.get("__state__") == "unloaded":
-            linux_modules.unload_module(self.kvm_module)
+            self.unload_kvm_module()
         elif self.initial_kvm_params.get("__state__") == "loaded":
-            param_args = " ".join(
-                f"{k}={v}"
-                for k, v in self.initial_kvm_params.items()
-                if k != "__state__"
-            )
+            initial_params = {
+                k: v for k, v in self.initial_kvm_params.items() if k != "__state__"
+            }
+
+            # Skip the unload/reload cycle when the test left the module
+            # parameters untouched.
+            try:
+                current_params = capture_module_parameters(
+                    f"/sys/module/{self.kvm_module}/parameters"
+                )
+            except OSError:
+                current_params = None
+            if current_params == initial_params:
+                self.log.info("KVM module parameters unchanged. Skipping reload.")
+                return
+
+            param_args = " ".join(f"{k}={v}" for k, v in initial_params.items())
             if param_args:
-                linux_modules.unload_module(self.kvm_module)
-                linux_modules.load_module(f"{self.kvm_module} {param_args}")
+                self.unload_kvm_module()
+                self.load_kvm_module(f"{self.kvm_module} {param_args}")